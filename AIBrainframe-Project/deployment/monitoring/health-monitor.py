@@ -37,6 +37,7 @@ class LBOBHealthMonitor:
             'check_interval': 30,  # seconds
             'failure_threshold': 3,  # consecutive failures before action
             'restart_cooldown': 300,  # seconds between restart attempts
+            'parse_health_body': False,  # parse /health JSON on every healthy check
         }
 
         self.failure_counts = {
@@ -61,7 +62,10 @@ class LBOBHealthMonitor:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                # Only parse the body when asked to, or while recovering from failures
+                data = None
+                if self.config['parse_health_body'] or self.failure_counts['lbob_api'] > 0:
+                    data = response.json()
                 return {
                     'status': 'healthy',
                     'response_time': response.elapsed.total_seconds(),